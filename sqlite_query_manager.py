@@ -1,15 +1,67 @@
 import sys
 import os
+import time
+import argparse
+
+_IMPORT_START = time.perf_counter()
+
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLineEdit, QTextEdit, 
                              QDialog, QLabel, QFormLayout, QMessageBox, QFileDialog, 
                              QSplitter, QTableView, QHeaderView, QTreeWidget, QTreeWidgetItem,
                              QComboBox, QCheckBox, QInputDialog)
 from PyQt6.QtGui import QColor, QPalette, QFont
-from PyQt6.QtCore import Qt, QAbstractTableModel
+from PyQt6.QtCore import Qt, QAbstractTableModel, QThread, QTimer, pyqtSignal
 import sqlite3
 import json
-import pandas as pd
+
+# Heavy libraries (pandas, and any charting/export libraries) are imported
+# inside the functions that use them so they don't slow down startup.
+# Add new ones here so the startup timing report flags them if they
+# are imported eagerly again.
+LAZY_MODULES = ("pandas", "matplotlib")
+
+_IMPORT_END = time.perf_counter()
+
+
+class StartupTimer:
+    def __init__(self):
+        self.phases = []
+
+    def record(self, phase, start, end):
+        self.phases.append((phase, end - start))
+
+    def report(self):
+        lines = ["Startup timing:"]
+        for phase, elapsed in self.phases:
+            lines.append(f"  {phase:<20}{elapsed * 1000:10.1f} ms")
+        total = sum(elapsed for _, elapsed in self.phases)
+        lines.append(f"  {'total':<20}{total * 1000:10.1f} ms")
+        for module in LAZY_MODULES:
+            if module in sys.modules:
+                lines.append(f"  warning: {module} was imported during startup")
+        return "\n".join(lines)
+
+
+class StateLoader(QThread):
+    loaded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filename, parent=None):
+        super().__init__(parent)
+        self.filename = filename
+
+    def run(self):
+        try:
+            with open(self.filename, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        if not isinstance(state, dict):
+            self.failed.emit("Invalid application state file format.")
+            return
+        self.loaded.emit(state)
 
 class PandasModel(QAbstractTableModel):
     def __init__(self, data):
@@ -202,6 +254,9 @@ class SQLiteQuestionManager(QMainWindow):
         self.questions = {}
         self.question_groups = {}
         self.current_results = {}
+        self.state_loader = None
+        self.state_load_started = None
+        self.startup_timer = None
         
         self.init_ui()
         self.set_style()
@@ -312,8 +367,8 @@ class SQLiteQuestionManager(QMainWindow):
         save_action = file_menu.addAction('Save State')
         save_action.triggered.connect(self.save_application_state)
         
-        load_action = file_menu.addAction('Load State')
-        load_action.triggered.connect(self.load_application_state)
+        self.load_state_action = file_menu.addAction('Load State')
+        self.load_state_action.triggered.connect(self.load_application_state)
 
         self.update_ui_state()
     
@@ -370,18 +425,25 @@ class SQLiteQuestionManager(QMainWindow):
         if file_path:
             self.db_path_input.setText(file_path)
     
+    def connect_database(self, db_path):
+        if not db_path or not os.path.exists(db_path):
+            return None, "Database file not found."
+        
+        try:
+            return sqlite3.connect(db_path), None
+        except sqlite3.Error as e:
+            return None, f"Failed to connect to database: {e}"
+    
     def load_database(self):
         self.db_path = self.db_path_input.text()
-        if not os.path.exists(self.db_path):
-            QMessageBox.warning(self, "Error", "Database file not found.")
+        conn, error = self.connect_database(self.db_path)
+        if error:
+            QMessageBox.warning(self, "Error", error)
             return
         
-        try:
-            self.conn = sqlite3.connect(self.db_path)
-            QMessageBox.information(self, "Success", "Database loaded successfully.")
-            self.update_ui_state()
-        except sqlite3.Error as e:
-            QMessageBox.warning(self, "Error", f"Failed to connect to database: {e}")
+        self.conn = conn
+        QMessageBox.information(self, "Success", "Database loaded successfully.")
+        self.update_ui_state()
     
     def unload_database(self):
         if self.conn:
@@ -459,6 +521,8 @@ class SQLiteQuestionManager(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select at least one question to run.")
             return
         
+        import pandas as pd
+        
         self.current_results.clear()
         self.result_selector.clear()
         
@@ -631,21 +695,97 @@ class SQLiteQuestionManager(QMainWindow):
     def load_application_state(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Load Application State", "", "JSON Files (*.json)")
         if filename:
-            with open(filename, 'r') as f:
-                state = json.load(f)
-            
-            self.db_path = state.get("db_path", "")
-            self.db_path_input.setText(self.db_path)
-            self.load_database()
-            
-            self.questions = state.get("questions", {})
-            self.question_groups = state.get("groups", {})
-            self.update_question_tree()
-            
+            self.restore_application_state(filename)
+    
+    def restore_application_state(self, filename):
+        # Read and parse the state file off the UI thread; the result is
+        # applied in on_state_loaded once the worker is done.
+        if self.state_loader is not None:
+            return
+        self.state_load_started = time.perf_counter()
+        self.load_state_action.setEnabled(False)
+        self.statusBar().showMessage("Loading application state...")
+        
+        self.state_loader = StateLoader(filename, self)
+        self.state_loader.loaded.connect(self.on_state_loaded)
+        self.state_loader.failed.connect(self.on_state_load_failed)
+        self.state_loader.finished.connect(self.on_state_loader_finished)
+        self.state_loader.start()
+    
+    def on_state_loaded(self, state):
+        self.questions = state.get("questions", {})
+        self.question_groups = state.get("groups", {})
+        self.update_question_tree()
+        
+        # Keep the current connection unless the restored database opens
+        db_path = state.get("db_path", "")
+        error = None
+        if db_path:
+            conn, error = self.connect_database(db_path)
+            if conn:
+                if self.conn:
+                    self.conn.close()
+                self.conn = conn
+                self.db_path = db_path
+                self.db_path_input.setText(db_path)
+        self.update_ui_state()
+        
+        self.statusBar().clearMessage()
+        self.finish_startup_timing()
+        if error:
+            QMessageBox.warning(self, "Error", f"Application state loaded, but the database could not be opened: {error}")
+        else:
             QMessageBox.information(self, "Success", "Application state loaded successfully.")
+    
+    def on_state_load_failed(self, error):
+        self.statusBar().clearMessage()
+        self.finish_startup_timing()
+        QMessageBox.warning(self, "Error", f"Failed to load application state: {error}")
+    
+    def on_state_loader_finished(self):
+        self.state_loader.deleteLater()
+        self.state_loader = None
+        self.load_state_action.setEnabled(True)
+    
+    def finish_startup_timing(self):
+        if self.startup_timer is None:
+            return
+        self.startup_timer.record("state restore", self.state_load_started, time.perf_counter())
+        print(self.startup_timer.report(), file=sys.stderr)
+        self.startup_timer = None
+    
+    def closeEvent(self, event):
+        # A QThread must not be destroyed while it is still running
+        if self.state_loader is not None:
+            self.state_loader.loaded.disconnect()
+            self.state_loader.failed.disconnect()
+            self.state_loader.wait()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
+    # Unknown arguments are left for Qt, which receives the full sys.argv
+    parser = argparse.ArgumentParser(description="SQLite Question Manager", allow_abbrev=False)
+    parser.add_argument("--state", metavar="FILE", help="application state file to restore after startup")
+    parser.add_argument("--startup-timing", action="store_true",
+                        help="print a breakdown of startup time to stderr")
+    args, _ = parser.parse_known_args()
+    
+    timer = StartupTimer()
+    timer.record("import", _IMPORT_START, _IMPORT_END)
+    
+    window_start = time.perf_counter()
     app = QApplication(sys.argv)
     window = SQLiteQuestionManager()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    timer.record("window construction", window_start, time.perf_counter())
+    
+    if args.startup_timing:
+        window.startup_timer = timer
+    
+    if args.state:
+        # Start restoring once the event loop is running so the window paints first
+        QTimer.singleShot(0, lambda: window.restore_application_state(args.state))
+    elif args.startup_timing:
+        print(timer.report(), file=sys.stderr)
+    
+    sys.exit(app.exec())